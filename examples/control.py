@@ -12,14 +12,23 @@ async def main():
         agreements = await toon.agreements()
         print(agreements)
 
+        # Fetch the status of all agreements concurrently
+        statuses = await asyncio.gather(
+            *(toon.update(agreement=agreement) for agreement in agreements)
+        )
+        for status in statuses:
+            print(status.agreement.display_common_name, status.thermostat)
+
         await toon.activate_agreement(agreement=agreements[0])
 
-        status = await toon.update()
-        print(status.gas_usage)
-        print(status.thermostat)
-        print(status.power_usage)
+        # Reuse the same client (and its connection) for every update
+        while True:
+            status = await toon.update()
+            print(status.gas_usage)
+            print(status.thermostat)
+            print(status.power_usage)
+            await asyncio.sleep(60)
 
 
 if __name__ == "__main__":
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(main())
+    asyncio.run(main())
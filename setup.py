@@ -1,26 +1,13 @@
 #!/usr/bin/env python
 """The setup script."""
 import os
-import re
-import sys
 
 from setuptools import find_packages, setup
 
-
-def get_version():
-    """Get current version from code."""
-    regex = r"__version__\s=\s\"(?P<version>[\d\.]+?)\""
-    path = ("toonapi", "__version__.py")
-    return re.search(regex, read(*path)).group("version")
-
-
-def read(*parts):
-    """Read file."""
-    filename = os.path.join(os.path.abspath(os.path.dirname(__file__)), *parts)
-    sys.stdout.write(filename)
-    with open(filename, encoding="utf-8") as fp:
-        return fp.read()
-
+about = {}
+here = os.path.abspath(os.path.dirname(__file__))
+with open(os.path.join(here, "toonapi", "__version__.py"), encoding="utf-8") as fp:
+    exec(fp.read(), about)  # pylint: disable=exec-used
 
 with open("README.md", encoding="utf-8") as readme_file:
     readme = readme_file.read()
@@ -44,7 +31,7 @@ setup(
     ],
     description="Asynchronous Python client for the Quby ToonAPI.",
     include_package_data=True,
-    install_requires=["aiohttp>=3.0.0", "backoff>=1.9.0", "yarl"],
+    install_requires=["aiohttp>=3.0.0", "backoff>=1.9.0", "orjson>=3.0.0", "yarl"],
     keywords=[
         "toon",
         "quby",
@@ -65,6 +52,6 @@ setup(
     packages=find_packages(include=["toonapi"]),
     test_suite="tests",
     url="https://github.com/frenck/python-toonapi",
-    version=get_version(),
+    version=about["__version__"],
     zip_safe=False,
 )
@@ -0,0 +1,233 @@
+"""Tests for the Quby ToonAPI models."""
+import weakref
+from datetime import datetime
+
+from toonapi.models import (
+    Agreement,
+    GasUsage,
+    PowerUsage,
+    Status,
+    ThermostatInfo,
+    WaterUsage,
+)
+
+THERMOSTAT_INFO = {
+    "activeState": 4,
+    "boilerModuleConnected": 1,
+    "burnerInfo": "2",
+    "currentDisplayTemp": 2050,
+    "currentHumidity": 45,
+    "currentModulationLevel": 0,
+    "currentSetpoint": 2100,
+    "errorFound": 255,
+    "hasBoilerFault": 0,
+    "haveOTBoiler": 1,
+    "nextProgram": -1,
+    "nextSetpoint": 1800,
+    "nextState": 2,
+    "nextTime": 1600000000123,
+    "otCommError": 0,
+    "programState": 2,
+    "realSetpoint": 2100,
+    "setByLoadShifting": 0,
+    "lastUpdatedFromDisplay": 1600000000456,
+}
+
+POWER_USAGE = {
+    "avgValue": 300.5,
+    "avgProduValue": 10,
+    "avgSolarValue": 20,
+    "value": 401.6,
+    "valueProduced": 0,
+    "valueSolar": 150.4,
+    "avgDayValue": 7345,
+    "dayCost": 1.5,
+    "dayUsage": 5554,
+    "dayLowUsage": 1234,
+    "maxSolar": 2000,
+    "solarProducedToday": 4321,
+    "isSmart": 1,
+    "meterReading": 1234567,
+    "meterReadingLow": 7654321,
+    "meterReadingProdu": 1111,
+    "meterReadingLowProdu": 2222,
+}
+
+
+def test_thermostat_info_update_from_dict():
+    """Test mapping and converting a thermostat info dictionary."""
+    thermostat = ThermostatInfo()
+    thermostat.update_from_dict(THERMOSTAT_INFO)
+
+    assert thermostat.active_state == 4
+    assert thermostat.boiler_module_connected is True
+    assert thermostat.burner_state == 2
+    assert thermostat.current_display_temperature == 20.5
+    assert thermostat.current_humidity == 45
+    assert thermostat.current_modulation_level == 0
+    assert thermostat.current_setpoint == 21.0
+    assert thermostat.error_found is False
+    assert thermostat.has_boiler_fault is False
+    assert thermostat.have_opentherm_boiler is True
+    assert thermostat.holiday_mode is True
+    assert thermostat.next_program is None
+    assert thermostat.next_setpoint == 18.0
+    assert thermostat.next_state == 2
+    assert thermostat.next_time == datetime(2020, 9, 13, 12, 26, 40, 123000)
+    assert thermostat.opentherm_communication_error is False
+    assert thermostat.program_state == 2
+    assert thermostat.real_setpoint == 21.0
+    assert thermostat.set_by_load_shifthing is False
+    assert thermostat.last_updated_from_display == datetime(
+        2020, 9, 13, 12, 26, 40, 456000
+    )
+
+    assert thermostat.burner is True
+    assert thermostat.hot_tapwater is True
+    assert thermostat.heating is False
+    assert thermostat.pre_heating is False
+    assert thermostat.program is True
+    assert thermostat.program_overridden is True
+
+
+def test_thermostat_info_partial_update():
+    """Test fields missing from an update keep their own previous value."""
+    thermostat = ThermostatInfo()
+    thermostat.update_from_dict(THERMOSTAT_INFO)
+    thermostat.update_from_dict({"currentSetpoint": 1900, "nextState": None})
+
+    assert thermostat.current_setpoint == 19.0
+    assert thermostat.next_state == 2
+    assert thermostat.next_time == datetime(2020, 9, 13, 12, 26, 40, 123000)
+
+
+def test_power_usage_update_from_dict():
+    """Test mapping and converting a power usage dictionary."""
+    power_usage = PowerUsage()
+    power_usage.update_from_dict(POWER_USAGE)
+
+    assert power_usage.average == 300.5
+    assert power_usage.average_produced == 10
+    assert power_usage.average_solar == 20
+    assert power_usage.current == 402
+    assert power_usage.current_produced == 0
+    assert power_usage.current_solar == 150
+    assert power_usage.day_average == 7.35
+    assert power_usage.day_cost == 1.5
+    assert power_usage.day_high_usage == 5.55
+    assert power_usage.day_low_usage == 1.23
+    assert power_usage.day_max_solar == 2000
+    assert power_usage.day_produced_solar == 4.32
+    assert power_usage.is_smart is True
+    assert power_usage.meter_high == 1234.57
+    assert power_usage.meter_low == 7654.32
+    assert power_usage.meter_produced_high == 1.11
+    assert power_usage.meter_produced_low == 2.22
+
+    assert power_usage.day_usage == 6.78
+    assert power_usage.current_covered_by_solar == 37
+
+    power_usage.update_from_dict({"value": 500})
+    assert power_usage.current == 500
+    assert power_usage.meter_high == 1234.57
+    assert power_usage.meter_produced_high == 1.11
+
+
+def test_gas_and_water_usage_update_from_dict():
+    """Test mapping and converting gas and water usage dictionaries."""
+    gas_usage = GasUsage()
+    gas_usage.update_from_dict({"value": 1234, "meterReading": 9876543})
+    assert gas_usage.current == 1.23
+    assert gas_usage.meter == 9876.54
+    assert gas_usage.average is None
+
+    water_usage = WaterUsage()
+    water_usage.update_from_dict({"value": 45, "installed": 1, "dayUsage": 7890})
+    assert water_usage.current == 0.8
+    assert water_usage.installed is True
+    assert water_usage.day_usage == 7.89
+
+
+def test_update_from_dict_is_generated():
+    """Test every model gets its own generated update_from_dict method."""
+    for model in (ThermostatInfo, PowerUsage, GasUsage, WaterUsage):
+        method = model.__dict__["update_from_dict"]
+        assert method.__qualname__ == f"{model.__name__}.update_from_dict"
+        assert model.__name__ in method.__doc__
+
+
+def test_models_are_slotted():
+    """Test model instances do not carry an instance dictionary."""
+    agreement = Agreement()
+    for instance in (
+        agreement,
+        ThermostatInfo(),
+        PowerUsage(),
+        GasUsage(),
+        WaterUsage(),
+        Status(agreement),
+    ):
+        assert not hasattr(instance, "__dict__")
+        assert weakref.ref(instance)() is instance
+
+
+def test_status_children_are_not_shared():
+    """Test every Status object has its own child models."""
+    status_1 = Status(Agreement(agreement_id="1"))
+    status_2 = Status(Agreement(agreement_id="2"))
+
+    assert status_1.thermostat is not status_2.thermostat
+    assert status_1.power_usage is not status_2.power_usage
+    assert status_1.gas_usage is not status_2.gas_usage
+    assert status_1.water_usage is not status_2.water_usage
+
+    status_1.update_from_dict({"thermostatInfo": {"currentSetpoint": 2000}})
+    assert status_1.thermostat.current_setpoint == 20.0
+    assert status_2.thermostat.current_setpoint is None
+
+
+def test_status_update_from_dict():
+    """Test a Status update stamps itself and its updated children alike."""
+    status = Status(Agreement())
+    status.update_from_dict(
+        {
+            "thermostatInfo": THERMOSTAT_INFO,
+            "gasUsage": None,
+            "serverTime": 1600000001000,
+            "lastUpdateFromDisplay": 1600000000999,
+        }
+    )
+
+    assert status.server_time == datetime(2020, 9, 13, 12, 26, 41)
+    assert status.last_updated_from_display == datetime(2020, 9, 13, 12, 26, 40, 999000)
+    assert status.thermostat.last_updated == status.last_updated
+    assert status.gas_usage.last_updated != status.last_updated
+
+
+def test_last_updated_round_trip():
+    """Test last_updated can be set and read back as a naive UTC datetime."""
+    moment = datetime(2020, 1, 2, 3, 4, 5, 678000)
+    for instance in (GasUsage(), Status(Agreement())):
+        assert isinstance(instance.last_updated, datetime)
+        assert instance.last_updated.tzinfo is None
+        instance.last_updated = moment
+        assert instance.last_updated == moment
+
+
+def test_agreement_from_dict():
+    """Test creating an Agreement from a dictionary."""
+    agreement = Agreement.from_dict(
+        {
+            "agreementId": "12345",
+            "displayCommonName": "eneco-001-123456",
+            "isToonSolar": False,
+        }
+    )
+
+    assert agreement == Agreement(
+        agreement_id="12345",
+        display_common_name="eneco-001-123456",
+        is_toon_solar=False,
+    )
+    assert agreement.city is None
+    assert "eneco-001-123456" in repr(agreement)
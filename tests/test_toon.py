@@ -0,0 +1,156 @@
+"""Tests for the Quby ToonAPI client."""
+import asyncio
+from dataclasses import replace
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from toonapi import Toon
+from toonapi.__version__ import __version__
+from toonapi.exceptions import ToonConnectionTimeoutError, ToonError
+from toonapi.models import Agreement
+
+AGREEMENTS = [
+    {"agreementId": "1", "displayCommonName": "eneco-001-000001"},
+    {"agreementId": "2", "displayCommonName": "eneco-001-000002"},
+]
+
+
+@pytest.mark.asyncio
+async def test_timeout_reading_body(aresponses):
+    """Test a body that is read too slowly is wrapped and retried."""
+    requests = []
+
+    async def response_handler(request):
+        """Send the headers right away, but stall before sending the body."""
+        requests.append(request)
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await asyncio.sleep(1)
+        await response.write(b"[]")
+        return response
+
+    aresponses.add("api.toon.eu", "/toon/v3/agreements", "GET", response_handler)
+    aresponses.add("api.toon.eu", "/toon/v3/agreements", "GET", response_handler)
+    aresponses.add("api.toon.eu", "/toon/v3/agreements", "GET", response_handler)
+
+    async with aiohttp.ClientSession() as session:
+        toon = Toon(token="abc", session=session, request_timeout=0.1)
+        with pytest.raises(ToonConnectionTimeoutError):
+            await toon.agreements()
+
+    assert len(requests) == 3
+
+
+def test_request_timeout():
+    """Test changing the request timeout applies to the next requests."""
+    toon = Toon(token="abc")
+    toon.request_timeout = 3
+    assert toon.request_timeout == 3
+    assert toon._timeout.total == 3  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_user_agent(aresponses):
+    """Test changing the user agent applies to the next requests."""
+    aresponses.add("api.toon.eu", "/toon/v3/agreements", "GET", [], repeat=4)
+
+    async with aiohttp.ClientSession() as session:
+        toon = Toon(token="abc", session=session)
+        await toon.agreements(force_update=True)
+        toon.user_agent = "Custom/1"
+        await toon.agreements(force_update=True)
+
+    async with Toon(token="abc", user_agent="Custom/2") as toon:
+        await toon.agreements(force_update=True)
+        toon.user_agent = "Custom/3"
+        await toon.agreements(force_update=True)
+
+    assert [entry.request.headers["User-Agent"] for entry in aresponses.history] == [
+        f"PythonToonAPI/{__version__}",
+        "Custom/1",
+        "Custom/2",
+        "Custom/3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_per_agreement(aresponses):
+    """Test concurrent updates each send the headers of their own agreement."""
+    agreement_ids = {}
+
+    def status_handler(request):
+        """Respond with a status, recording the agreement it was asked for."""
+        agreement_id = request.headers["X-Agreement-ID"]
+        agreement_ids[request.path] = agreement_id
+        return web.json_response(
+            {"thermostatInfo": {"currentSetpoint": int(agreement_id) * 100}}
+        )
+
+    aresponses.add("api.toon.eu", "/toon/v3/agreements", "GET", AGREEMENTS)
+    aresponses.add("api.toon.eu", "/toon/v3/1/status", "GET", status_handler)
+    aresponses.add("api.toon.eu", "/toon/v3/2/status", "GET", status_handler)
+
+    async with aiohttp.ClientSession() as session:
+        toon = Toon(token="abc", session=session)
+        agreements = await toon.agreements()
+        statuses = await asyncio.gather(
+            *(toon.update(agreement=agreement) for agreement in agreements)
+        )
+        active = await toon.activate_agreement(agreement=agreements[1])
+
+    assert agreement_ids == {"/toon/v3/1/status": "1", "/toon/v3/2/status": "2"}
+    assert [status.agreement for status in statuses] == agreements
+    assert statuses[0].thermostat.current_setpoint == 1.0
+    assert statuses[1].thermostat.current_setpoint == 2.0
+    assert active == agreements[1]
+    # pylint: disable-next=protected-access
+    assert toon._status is statuses[1]
+
+
+@pytest.mark.asyncio
+async def test_activate_agreement(aresponses):
+    """Test activating agreements by object, ID and display common name."""
+    aresponses.add(
+        "api.toon.eu",
+        "/toon/v3/agreements",
+        "GET",
+        [
+            *AGREEMENTS,
+            {"agreementId": "1", "displayCommonName": "eneco-001-000003"},
+            {"agreementId": "4", "displayCommonName": "eneco-001-000002"},
+            {"displayCommonName": "eneco-001-000005"},
+        ],
+    )
+
+    async with aiohttp.ClientSession() as session:
+        toon = Toon(token="abc", session=session)
+        agreements = await toon.agreements()
+
+        assert await toon.activate_agreement(agreement_id="2") is agreements[1]
+        assert toon.agreement_id == "2"
+        assert (
+            await toon.activate_agreement(display_common_name="eneco-001-000001")
+            is agreements[0]
+        )
+        assert toon.display_common_name == "eneco-001-000001"
+
+        # The first agreement wins when an ID or common name is not unique
+        assert await toon.activate_agreement(agreement_id="1") is agreements[0]
+        assert (
+            await toon.activate_agreement(display_common_name="eneco-001-000002")
+            is agreements[1]
+        )
+
+        # Agreements passed in are matched on equality
+        assert (
+            await toon.activate_agreement(agreement=replace(agreements[2]))
+            is agreements[2]
+        )
+        assert await toon.activate_agreement(agreement=agreements[4]) is agreements[4]
+
+        with pytest.raises(ToonError, match="could not be found"):
+            await toon.activate_agreement(agreement_id="5")
+        with pytest.raises(ToonError, match="could not be found"):
+            await toon.activate_agreement(agreement=Agreement(agreement_id="2"))
@@ -1,6 +1,10 @@
 """Asynchronous Python client for Quby."""
+from __future__ import annotations
 
-from .const import (  # noqa
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .const import (
     ACTIVE_STATE_AWAY,
     ACTIVE_STATE_COMFORT,
     ACTIVE_STATE_HOLIDAY,
@@ -16,5 +20,54 @@ from .const import (  # noqa
     PROGRAM_STATE_ON,
     PROGRAM_STATE_OVERRIDE,
 )
-from .models import Agreement, Status  # noqa
-from .toon import Toon, ToonConnectionError, ToonError  # noqa
+
+if TYPE_CHECKING:
+    from .exceptions import ToonConnectionError, ToonError
+    from .models import Agreement, Status
+    from .toon import Toon
+
+# Imported on first access (PEP 562), so importing constants or exceptions
+# does not pull in aiohttp and friends.
+_LAZY_IMPORTS = {
+    "Agreement": ".models",
+    "Status": ".models",
+    "Toon": ".toon",
+    "ToonConnectionError": ".exceptions",
+    "ToonError": ".exceptions",
+}
+
+__all__ = [
+    "ACTIVE_STATE_AWAY",
+    "ACTIVE_STATE_COMFORT",
+    "ACTIVE_STATE_HOLIDAY",
+    "ACTIVE_STATE_HOME",
+    "ACTIVE_STATE_NONE",
+    "ACTIVE_STATE_OFF",
+    "ACTIVE_STATE_SLEEP",
+    "BURNER_STATE_OFF",
+    "BURNER_STATE_ON",
+    "BURNER_STATE_PREHEATING",
+    "BURNER_STATE_TAP_WATER",
+    "PROGRAM_STATE_OFF",
+    "PROGRAM_STATE_ON",
+    "PROGRAM_STATE_OVERRIDE",
+    "Agreement",
+    "Status",
+    "Toon",
+    "ToonConnectionError",
+    "ToonError",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes of this package on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported classes along with the module attributes."""
+    return sorted({*globals(), *__all__})
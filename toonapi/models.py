@@ -1,12 +1,14 @@
 """Models for the Quby ToonAPI."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar, Optional, Tuple, TypeVar
 
 from .const import (
     ACTIVE_STATE_HOLIDAY,
+    BURNER_STATE_OFF,
     BURNER_STATE_ON,
     BURNER_STATE_PREHEATING,
     BURNER_STATE_TAP_WATER,
@@ -24,26 +26,164 @@ from .util import (
     convert_temperature,
 )
 
+_FieldSpec = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
+_T = TypeVar("_T")
+
+# Burner state -> (burner, hot_tapwater, heating, pre_heating)
+_BURNER_STATES: dict[int | None, tuple[bool | None, ...]] = {
+    None: (None, None, None, None),
+    BURNER_STATE_OFF: (False, False, False, False),
+    BURNER_STATE_ON: (True, False, True, False),
+    BURNER_STATE_TAP_WATER: (True, True, False, False),
+    BURNER_STATE_PREHEATING: (True, False, False, True),
+}
+_BURNER_STATE_UNKNOWN = (True, False, False, False)
+
+# Program state -> (program, program_overridden)
+_PROGRAM_STATES: dict[int | None, tuple[bool | None, ...]] = {
+    None: (None, None),
+    PROGRAM_STATE_ON: (True, False),
+    PROGRAM_STATE_OVERRIDE: (True, True),
+}
+_PROGRAM_STATE_UNKNOWN = (False, False)
+
+
+def _convert_error_found(value: int) -> bool:
+    """Convert an error code from the ToonAPI to a boolean (255 is no error)."""
+    return value != 255
+
+
+def _convert_holiday_mode(active_state: int) -> bool:
+    """Convert an active state from the ToonAPI to a holiday mode boolean."""
+    return active_state == ACTIVE_STATE_HOLIDAY
+
+
+def _add_slots(cls: type[_T]) -> type[_T]:
+    """Recreate a dataclass with its fields stored in __slots__.
+
+    Backport of ``@dataclass(slots=True)``, which is only available as of
+    Python 3.10. Must be applied on top of the ``@dataclass`` decorator.
+    Instances stay weak-referenceable.
+
+    Methods of the rebuilt class cannot use zero-argument ``super()``, as their
+    ``__class__`` cell still refers to the original class; call the base class
+    explicitly instead.
+    """
+    field_names = tuple(field.name for field in fields(cls))  # type: ignore[arg-type]
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    if not any(base.__weakrefoffset__ for base in cls.__bases__):
+        namespace["__slots__"] += ("__weakref__",)
+    for name in field_names:
+        # Defaults are kept by the generated __init__, not as class attributes
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def _compile_update_from_dict(cls: type[_Model]) -> Callable[..., None]:
+    """Generate a straight-line update_from_dict method from a field table.
+
+    Every entry of ``cls._FIELDS`` is emitted as an inlined lookup, None check
+    and (converted) attribute assignment, so no per-field function call or
+    table iteration remains at runtime. Conversion functions and the clock
+    are bound as closure variables of the generated method, avoiding global
+    and attribute lookups on every call.
+    """
+    closure: dict[str, Any] = {"_time": time.time}
+    body = ["        get = data.get"]
+    for index, (key, attr, conversion) in enumerate(cls._FIELDS):
+        body.append(f"        value = get({key!r})")
+        body.append("        if value is not None:")
+        if conversion is None:
+            body.append(f"            self.{attr} = value")
+        else:
+            closure[f"_convert_{index}"] = conversion
+            body.append(f"            self.{attr} = _convert_{index}(value)")
+    body.append(
+        "        self._last_updated_ts = _time() if timestamp is None else timestamp"
+    )
+
+    lines = [
+        f"def _make({', '.join(closure)}):",
+        "    def update_from_dict(self, data, *, timestamp=None):",
+        *body,
+        "    return update_from_dict",
+    ]
+    namespace: dict[str, Any] = {}
+    filename = f"<generated {cls.__qualname__}.update_from_dict>"
+    exec(  # pylint: disable=exec-used
+        compile("\n".join(lines), filename, "exec"), namespace
+    )
+    method = namespace["_make"](**closure)
+    method.__doc__ = f"Update this {cls.__name__} object with data from a dictionary."
+    method.__module__ = cls.__module__
+    method.__qualname__ = f"{cls.__qualname__}.update_from_dict"
+    return method  # type: ignore[no-any-return]
+
+
+class _Timestamped:
+    """Base for objects that keep track of when they were last updated.
+
+    The moment of the last update is stored as a plain float timestamp; the
+    datetime object is only created when ``last_updated`` is accessed.
+    """
+
+    __slots__ = ("_last_updated_ts", "__weakref__")
+
+    def __init__(self) -> None:
+        """Initialize the last updated timestamp."""
+        self._last_updated_ts = time.time()
 
-def process_data(
-    data: dict[str, Any],
-    key: str,
-    current_value: Any,
-    conversion: Callable[[Any], Any] | None = None,
-) -> Any:
-    """test."""
-    if key not in data:
-        return current_value
+    @property
+    def last_updated(self) -> datetime:
+        """Return when this object was last updated, as a naive UTC datetime."""
+        return datetime.fromtimestamp(self._last_updated_ts, tz=timezone.utc).replace(
+            tzinfo=None
+        )
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        """Set when this object was last updated, from a naive UTC datetime."""
+        self._last_updated_ts = value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class _Model(_Timestamped):
+    """Base for models that are updated from ToonAPI data dictionaries.
+
+    Subclasses declare a ``_FIELDS`` table, from which a specialized
+    ``update_from_dict`` method is generated when the class is created.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: ClassVar[_FieldSpec] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate the update_from_dict method for a model subclass."""
+        super().__init_subclass__(**kwargs)
+        if "update_from_dict" not in cls.__dict__:
+            setattr(cls, "update_from_dict", _compile_update_from_dict(cls))
 
-    if data[key] is None:
-        return current_value
+    def __post_init__(self) -> None:
+        """Initialize the last updated timestamp of a model dataclass."""
+        _Timestamped.__init__(self)
 
-    if conversion is None:
-        return data[key]
+    def update_from_dict(
+        self, data: dict[str, Any], *, timestamp: float | None = None
+    ) -> None:
+        """Update this object with data from a dictionary.
 
-    return conversion(data[key])
+        The time of the update (as returned by time.time()) can be passed in
+        as timestamp, so objects updated together share the same moment.
 
+        Replaced by a generated method on every subclass, see __init_subclass__.
+        """
 
+
+@_add_slots
 @dataclass
 class Agreement:
     """Object holding a Toon customer utility Agreement."""
@@ -61,27 +201,40 @@ class Agreement:
     postal_code: str | None = None
     street: str | None = None
 
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("agreementIdChecksum", "agreement_id_checksum"),
+        ("agreementId", "agreement_id"),
+        ("city", "city"),
+        ("displayCommonName", "display_common_name"),
+        ("displayHardwareVersion", "display_hardware_version"),
+        ("displaySoftwareVersion", "display_software_version"),
+        ("heatingType", "heating_type"),
+        ("houseNumber", "house_number"),
+        ("isToonSolar", "is_toon_solar"),
+        ("isToonly", "is_toonly"),
+        ("postalCode", "postal_code"),
+        ("street", "street"),
+    )
+
     @staticmethod
     def from_dict(data: dict[str, Any]) -> Agreement:
         """Return an Agreement object from a data dictionary."""
-        return Agreement(
-            agreement_id_checksum=data.get("agreementIdChecksum"),
-            agreement_id=data.get("agreementId"),
-            city=data.get("city"),
-            display_common_name=data.get("displayCommonName"),
-            display_hardware_version=data.get("displayHardwareVersion"),
-            display_software_version=data.get("displaySoftwareVersion"),
-            heating_type=data.get("heatingType"),
-            house_number=data.get("houseNumber"),
-            is_toon_solar=data.get("isToonSolar"),
-            is_toonly=data.get("isToonly"),
-            postal_code=data.get("postalCode"),
-            street=data.get("street"),
-        )
+        # Every field is set below, so the dataclass __init__ can be skipped
+        agreement = Agreement.__new__(Agreement)
+        for key, attr in Agreement._FIELDS:
+            setattr(agreement, attr, data.get(key))
+        return agreement
+
 
+# from_dict() skips __init__, so the table must cover every dataclass field
+_AGREEMENT_ATTRS = {attr for _, attr in Agreement._FIELDS}
+if _AGREEMENT_ATTRS != {field.name for field in fields(Agreement)}:  # pragma: no cover
+    raise TypeError("Agreement._FIELDS does not match the Agreement fields")
 
+
+@_add_slots
 @dataclass
-class ThermostatInfo:
+class ThermostatInfo(_Model):
     """Object holding Toon thermostat information."""
 
     active_state: int | None = None
@@ -105,120 +258,64 @@ class ThermostatInfo:
     set_by_load_shifthing: int | None = None
 
     last_updated_from_display: datetime | None = None
-    last_updated: datetime = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+    _FIELDS: ClassVar[_FieldSpec] = (
+        ("activeState", "active_state", convert_negative_none),
+        ("boilerModuleConnected", "boiler_module_connected", convert_boolean),
+        ("burnerInfo", "burner_state", int),
+        ("currentDisplayTemp", "current_display_temperature", convert_temperature),
+        ("currentHumidity", "current_humidity", None),
+        ("currentModulationLevel", "current_modulation_level", None),
+        ("currentSetpoint", "current_setpoint", convert_temperature),
+        ("errorFound", "error_found", _convert_error_found),
+        ("hasBoilerFault", "has_boiler_fault", convert_boolean),
+        ("haveOTBoiler", "have_opentherm_boiler", convert_boolean),
+        ("activeState", "holiday_mode", _convert_holiday_mode),
+        ("nextProgram", "next_program", convert_negative_none),
+        ("nextSetpoint", "next_setpoint", convert_temperature),
+        ("nextState", "next_state", convert_negative_none),
+        ("nextTime", "next_time", convert_datetime),
+        ("otCommError", "opentherm_communication_error", convert_boolean),
+        ("programState", "program_state", None),
+        ("realSetpoint", "real_setpoint", convert_temperature),
+        ("setByLoadShifting", "set_by_load_shifthing", convert_boolean),
+        ("lastUpdatedFromDisplay", "last_updated_from_display", convert_datetime),
+    )
 
     @property
     def burner(self) -> bool | None:
         """Return if burner is on based on its state."""
-        if self.burner_state is None:
-            return None
-        return bool(self.burner_state)
+        return _BURNER_STATES.get(self.burner_state, _BURNER_STATE_UNKNOWN)[0]
 
     @property
     def hot_tapwater(self) -> bool | None:
         """Return if burner is on based on its state."""
-        if self.burner_state is None:
-            return None
-        return self.burner_state == BURNER_STATE_TAP_WATER
+        return _BURNER_STATES.get(self.burner_state, _BURNER_STATE_UNKNOWN)[1]
 
     @property
     def heating(self) -> bool | None:
         """Return if burner is pre heating based on its state."""
-        if self.burner_state is None:
-            return None
-        return self.burner_state == BURNER_STATE_ON
+        return _BURNER_STATES.get(self.burner_state, _BURNER_STATE_UNKNOWN)[2]
 
     @property
     def pre_heating(self) -> bool | None:
         """Return if burner is pre heating based on its state."""
-        if self.burner_state is None:
-            return None
-        return self.burner_state == BURNER_STATE_PREHEATING
+        return _BURNER_STATES.get(self.burner_state, _BURNER_STATE_UNKNOWN)[3]
 
     @property
     def program(self) -> bool | None:
         """Return if program mode is turned on."""
-        if self.program_state is None:
-            return None
-        return self.program_state in [PROGRAM_STATE_ON, PROGRAM_STATE_OVERRIDE]
+        return _PROGRAM_STATES.get(self.program_state, _PROGRAM_STATE_UNKNOWN)[0]
 
     @property
     def program_overridden(self) -> bool | None:
         """Return if program mode is overriden."""
-        if self.program_state is None:
-            return None
-        return self.program_state == PROGRAM_STATE_OVERRIDE
-
-    def update_from_dict(self, data: dict[str, Any]) -> None:
-        """Update this ThermostatInfo object with data from a dictionary."""
-        self.active_state = process_data(
-            data, "activeState", self.active_state, convert_negative_none
-        )
-        self.boiler_module_connected = process_data(
-            data, "boilerModuleConnected", self.boiler_module_connected, convert_boolean
-        )
-        self.burner_state = process_data(data, "burnerInfo", self.burner_state, int)
-        self.current_display_temperature = process_data(
-            data,
-            "currentDisplayTemp",
-            self.current_display_temperature,
-            convert_temperature,
-        )
-        self.current_humidity = process_data(
-            data, "currentHumidity", self.current_humidity
-        )
-        self.current_modulation_level = process_data(
-            data, "currentModulationLevel", self.current_modulation_level
-        )
-        self.current_setpoint = process_data(
-            data, "currentSetpoint", self.current_setpoint, convert_temperature
-        )
-        self.error_found = process_data(
-            data, "errorFound", self.error_found, lambda x: x != 255
-        )
-        self.has_boiler_fault = process_data(
-            data, "hasBoilerFault", self.has_boiler_fault, convert_boolean
-        )
-        self.have_opentherm_boiler = process_data(
-            data, "haveOTBoiler", self.have_opentherm_boiler, convert_boolean
-        )
-        self.holiday_mode = process_data(
-            data, "activeState", self.holiday_mode, lambda x: x == ACTIVE_STATE_HOLIDAY
-        )
-        self.next_program = process_data(
-            data, "nextProgram", self.next_program, convert_negative_none
-        )
-        self.next_setpoint = process_data(
-            data, "nextSetpoint", self.next_setpoint, convert_temperature
-        )
-        self.next_state = process_data(
-            data, "nextState", self.next_state, convert_negative_none
-        )
-        self.next_time = process_data(
-            data, "nextTime", self.next_state, convert_datetime
-        )
-        self.opentherm_communication_error = process_data(
-            data, "otCommError", self.opentherm_communication_error, convert_boolean
-        )
-        self.program_state = process_data(data, "programState", self.program_state)
-        self.real_setpoint = process_data(
-            data, "realSetpoint", self.real_setpoint, convert_temperature
-        )
-        self.set_by_load_shifthing = process_data(
-            data, "setByLoadShifting", self.set_by_load_shifthing, convert_boolean
-        )
-
-        self.last_updated_from_display = process_data(
-            data,
-            "lastUpdatedFromDisplay",
-            self.last_updated_from_display,
-            convert_datetime,
-        )
-        self.last_updated = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        return _PROGRAM_STATES.get(self.program_state, _PROGRAM_STATE_UNKNOWN)[1]
 
 
+@_add_slots
 @dataclass
-class PowerUsage:
+class PowerUsage(_Model):
     """Object holding Toon power usage information."""
 
     average_produced: float | None = None
@@ -240,7 +337,27 @@ class PowerUsage:
     meter_produced_low: float | None = None
 
     last_updated_from_display: datetime | None = None
-    last_updated: datetime = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+    _FIELDS: ClassVar[_FieldSpec] = (
+        ("avgValue", "average", None),
+        ("avgProduValue", "average_produced", None),
+        ("avgSolarValue", "average_solar", None),
+        ("value", "current", round),
+        ("valueProduced", "current_produced", round),
+        ("valueSolar", "current_solar", round),
+        ("avgDayValue", "day_average", convert_kwh),
+        ("dayCost", "day_cost", None),
+        ("dayUsage", "day_high_usage", convert_kwh),
+        ("dayLowUsage", "day_low_usage", convert_kwh),
+        ("maxSolar", "day_max_solar", None),
+        ("solarProducedToday", "day_produced_solar", convert_kwh),
+        ("isSmart", "is_smart", convert_boolean),
+        ("meterReading", "meter_high", convert_kwh),
+        ("meterReadingLow", "meter_low", convert_kwh),
+        ("meterReadingProdu", "meter_produced_high", convert_kwh),
+        ("meterReadingLowProdu", "meter_produced_low", convert_kwh),
+        ("lastUpdatedFromDisplay", "last_updated_from_display", convert_datetime),
+    )
 
     @property
     def day_usage(self) -> float | None:
@@ -270,59 +387,13 @@ class PowerUsage:
             return None
         if self.current == 0:
             return 0
-        return min(100, round((self.current_solar / self.current) * 100))
-
-    def update_from_dict(self, data: dict[str, Any]) -> None:
-        """Update this PowerUsage object with data from a dictionary."""
-        self.average = process_data(data, "avgValue", self.average)
-        self.average_produced = process_data(
-            data, "avgProduValue", self.average_produced
-        )
-        self.average_solar = process_data(data, "avgSolarValue", self.average_solar)
-        self.current = process_data(data, "value", self.current, round)
-        self.current_produced = process_data(
-            data, "valueProduced", self.current_produced, round
-        )
-        self.current_solar = process_data(data, "valueSolar", self.current_solar, round)
-        self.day_average = process_data(
-            data, "avgDayValue", self.day_average, convert_kwh
-        )
-        self.day_cost = process_data(data, "dayCost", self.day_cost)
-        self.day_high_usage = process_data(
-            data, "dayUsage", self.day_high_usage, convert_kwh
-        )
-        self.day_low_usage = process_data(
-            data, "dayLowUsage", self.day_low_usage, convert_kwh
-        )
-        self.day_max_solar = process_data(data, "maxSolar", self.day_max_solar)
-        self.day_produced_solar = process_data(
-            data, "solarProducedToday", self.day_produced_solar, convert_kwh
-        )
-        self.is_smart = process_data(data, "isSmart", self.is_smart, convert_boolean)
-        self.meter_high = process_data(
-            data, "meterReading", self.meter_high, convert_kwh
-        )
-        self.meter_low = process_data(
-            data, "meterReadingLow", self.meter_low, convert_kwh
-        )
-        self.meter_produced_high = process_data(
-            data, "meterReadingProdu", self.meter_high, convert_kwh
-        )
-        self.meter_produced_low = process_data(
-            data, "meterReadingLowProdu", self.meter_produced_low, convert_kwh
-        )
-
-        self.last_updated_from_display = process_data(
-            data,
-            "lastUpdatedFromDisplay",
-            self.last_updated_from_display,
-            convert_datetime,
-        )
-        self.last_updated = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        # Round half up using integer math only; both values are whole watts
+        return min(100, (self.current_solar * 200 + self.current) // (self.current * 2))
 
 
+@_add_slots
 @dataclass
-class GasUsage:
+class GasUsage(_Model):
     """Object holding Toon gas usage information."""
 
     average: float | None = None
@@ -334,31 +405,22 @@ class GasUsage:
     meter: float | None = None
 
     last_updated_from_display: datetime | None = None
-    last_updated: datetime = datetime.now(tz=timezone.utc).replace(tzinfo=None)
-
-    def update_from_dict(self, data: dict[str, Any]) -> None:
-        """Update this GasUsage object with data from a dictionary."""
-        self.average = process_data(data, "avgValue", self.average, convert_cm3)
-        self.current = process_data(data, "value", self.current, convert_cm3)
-        self.day_average = process_data(
-            data, "avgDayValue", self.day_average, convert_cm3
-        )
-        self.day_cost = process_data(data, "dayCost", self.day_cost)
-        self.day_usage = process_data(data, "dayUsage", self.day_usage, convert_cm3)
-        self.is_smart = process_data(data, "isSmart", self.is_smart, convert_boolean)
-        self.meter = process_data(data, "meterReading", self.meter, convert_cm3)
-
-        self.last_updated_from_display = process_data(
-            data,
-            "lastUpdatedFromDisplay",
-            self.last_updated_from_display,
-            convert_datetime,
-        )
-        self.last_update = datetime.now(tz=timezone.utc).replace(tzinfo=None)
 
+    _FIELDS: ClassVar[_FieldSpec] = (
+        ("avgValue", "average", convert_cm3),
+        ("value", "current", convert_cm3),
+        ("avgDayValue", "day_average", convert_cm3),
+        ("dayCost", "day_cost", None),
+        ("dayUsage", "day_usage", convert_cm3),
+        ("isSmart", "is_smart", convert_boolean),
+        ("meterReading", "meter", convert_cm3),
+        ("lastUpdatedFromDisplay", "last_updated_from_display", convert_datetime),
+    )
 
+
+@_add_slots
 @dataclass
-class WaterUsage:
+class WaterUsage(_Model):
     """Object holding Toon water usage information."""
 
     average: float | None = None
@@ -371,64 +433,76 @@ class WaterUsage:
     meter: float | None = None
 
     last_updated_from_display: datetime | None = None
-    last_updated = datetime.now(tz=timezone.utc).replace(tzinfo=None)
-
-    def update_from_dict(self, data: dict[str, Any]) -> None:
-        """Update this WaterUsage object with data from a dictionary."""
-        self.average = process_data(data, "avgValue", self.average, convert_lmin)
-        self.current = process_data(data, "value", self.current, convert_lmin)
-        self.day_average = process_data(
-            data, "avgDayValue", self.day_average, convert_m3
-        )
-        self.day_cost = process_data(data, "dayCost", self.day_cost)
-        self.day_usage = process_data(data, "dayUsage", self.day_usage, convert_m3)
-        self.installed = process_data(
-            data, "installed", self.installed, convert_boolean
-        )
-        self.is_smart = process_data(data, "isSmart", self.is_smart, convert_boolean)
-        self.meter = process_data(data, "meterReading", self.meter, convert_m3)
-        self.last_updated_from_display = process_data(
-            data,
-            "lastUpdatedFromDisplay",
-            self.last_updated_from_display,
-            convert_datetime,
-        )
-        self.last_update = datetime.now(tz=timezone.utc).replace(tzinfo=None)
 
+    _FIELDS: ClassVar[_FieldSpec] = (
+        ("avgValue", "average", convert_lmin),
+        ("value", "current", convert_lmin),
+        ("avgDayValue", "day_average", convert_m3),
+        ("dayCost", "day_cost", None),
+        ("dayUsage", "day_usage", convert_m3),
+        ("installed", "installed", convert_boolean),
+        ("isSmart", "is_smart", convert_boolean),
+        ("meterReading", "meter", convert_m3),
+        ("lastUpdatedFromDisplay", "last_updated_from_display", convert_datetime),
+    )
 
-class Status:
+
+class Status(_Timestamped):
     """Object holding all status information for this ToonAPI instance."""
 
+    __slots__ = (
+        "agreement",
+        "thermostat",
+        "power_usage",
+        "gas_usage",
+        "water_usage",
+        "last_updated_from_display",
+        "server_time",
+    )
+
     agreement: Agreement
-    thermostat: ThermostatInfo = ThermostatInfo()
-    power_usage: PowerUsage = PowerUsage()
-    gas_usage: GasUsage = GasUsage()
-    water_usage: WaterUsage = WaterUsage()
+    thermostat: ThermostatInfo
+    power_usage: PowerUsage
+    gas_usage: GasUsage
+    water_usage: WaterUsage
 
-    last_updated_from_display: datetime | None = None
-    last_updated: datetime = datetime.now(tz=timezone.utc).replace(tzinfo=None)
-    server_time: datetime | None = None
+    last_updated_from_display: datetime | None
+    server_time: datetime | None
 
     def __init__(self, agreement: Agreement):
         """Initialize an empty ToonAPI Status class."""
+        super().__init__()
         self.agreement = agreement
+        self.thermostat = ThermostatInfo()
+        self.power_usage = PowerUsage()
+        self.gas_usage = GasUsage()
+        self.water_usage = WaterUsage()
+
+        self.last_updated_from_display = None
+        self.server_time = None
 
     def update_from_dict(self, data: dict[str, Any]) -> Status:
         """Update the status object with data received from the ToonAPI."""
-        if "thermostatInfo" in data:
-            self.thermostat.update_from_dict(data["thermostatInfo"])
-        if "powerUsage" in data:
-            self.power_usage.update_from_dict(data["powerUsage"])
-        if "gasUsage" in data:
-            self.gas_usage.update_from_dict(data["gasUsage"])
-        if "waterUsage" in data:
-            self.water_usage.update_from_dict(data["waterUsage"])
-        if "lastUpdateFromDisplay" in data:
-            self.last_updated_from_display = convert_datetime(
-                data["lastUpdateFromDisplay"]
-            )
-        if "serverTime" in data:
-            self.server_time = convert_datetime(data["serverTime"])
-        self.last_updated = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        now = time.time()
+        get = data.get
+        thermostat = get("thermostatInfo")
+        if thermostat is not None:
+            self.thermostat.update_from_dict(thermostat, timestamp=now)
+        power_usage = get("powerUsage")
+        if power_usage is not None:
+            self.power_usage.update_from_dict(power_usage, timestamp=now)
+        gas_usage = get("gasUsage")
+        if gas_usage is not None:
+            self.gas_usage.update_from_dict(gas_usage, timestamp=now)
+        water_usage = get("waterUsage")
+        if water_usage is not None:
+            self.water_usage.update_from_dict(water_usage, timestamp=now)
+        last_updated_from_display = get("lastUpdateFromDisplay")
+        if last_updated_from_display is not None:
+            self.last_updated_from_display = convert_datetime(last_updated_from_display)
+        server_time = get("serverTime")
+        if server_time is not None:
+            self.server_time = convert_datetime(server_time)
+        self._last_updated_ts = now
 
         return self
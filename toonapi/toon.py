@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import socket
 from typing import Any, Awaitable, Callable
 
 import aiohttp
-import async_timeout
 import backoff
 from yarl import URL
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads  # type: ignore[assignment]
+
 from .__version__ import __version__
 from .const import (
     ACTIVE_STATE_OFF,
@@ -53,14 +56,29 @@ class Toon:
         """Initialize connection with the Quby ToonAPI."""
         self._session = session
 
+        if user_agent is None:
+            user_agent = f"PythonToonAPI/{__version__}"
+
         self.request_timeout = request_timeout
+        self._session_user_agent: str | None = None
         self.user_agent = user_agent
         self.token = token
+        self._authorization_token: str | None = None
+        self._authorization = ""
 
         self.token_refresh_method = token_refresh_method
 
-        if user_agent is None:
-            self.user_agent = f"PythonToonAPI/{__version__}"
+        self._agreements_by_id: dict[str, Agreement] = {}
+        self._agreements_by_name: dict[str, Agreement] = {}
+        self._agreement_statuses: dict[str | None, Status] = {}
+
+        self._base_url = URL.build(
+            scheme=TOON_API_SCHEME,
+            host=TOON_API_HOST,
+            port=TOON_API_PORT,
+            path=TOON_API_BASE_PATH,
+        )
+        self._urls: dict[str, URL] = {}
 
     @backoff.on_exception(backoff.expo, ToonConnectionError, max_tries=3, logger=None)
     @backoff.on_exception(
@@ -73,6 +91,7 @@ class Toon:
         data: Any | None = None,
         method: str = "GET",
         no_agreement: bool = False,
+        agreement: Agreement | None = None,
     ) -> Any:
         """Handle a request to the Quby ToonAPI."""
         if self.token_refresh_method is not None:
@@ -83,40 +102,77 @@ class Toon:
                 agreement_id=self.agreement_id,
             )
 
-        url = URL.build(
-            scheme=TOON_API_SCHEME,
-            host=TOON_API_HOST,
-            port=TOON_API_PORT,
-            path=TOON_API_BASE_PATH,
-        ).join(URL(uri))
-
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "User-Agent": self.user_agent,
-            "Accept": "application/json",
-        }
-
-        if not no_agreement and self._status is not None:
-            headers.update(
-                {
-                    "X-Common-Name": self._status.agreement.display_common_name,
-                    "X-Agreement-ID": self._status.agreement.agreement_id,
-                }
-            )
+        # Only a handful of endpoints are used, so cache their parsed URLs
+        url = self._urls.get(uri)
+        if url is None:
+            url = self._urls[uri] = self._base_url.join(URL(uri))
 
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20, limit_per_host=10, keepalive_timeout=75
+                ),
+                headers=self._base_headers,
+            )
             self._close_session = True
-
+            self._session_user_agent = self._user_agent
+
+        # Only rebuild the Authorization header when the token has changed
+        if self.token != self._authorization_token:
+            self._authorization_token = self.token
+            self._authorization = f"Bearer {self.token}"
+
+        headers: dict[str, str] = {"Authorization": self._authorization}
+        if not self._close_session:
+            # A session passed in by the caller lacks our default headers
+            headers.update(self._base_headers)
+        elif self._user_agent != self._session_user_agent:
+            # The user agent was changed after our session was created
+            headers["User-Agent"] = self._user_agent
+
+        if not no_agreement and agreement is None and self._status is not None:
+            agreement = self._status.agreement
+
+        if not no_agreement and agreement is not None:
+            if agreement.display_common_name is not None:
+                headers["X-Common-Name"] = agreement.display_common_name
+            if agreement.agreement_id is not None:
+                headers["X-Agreement-ID"] = agreement.agreement_id
+
+        # The total timeout also covers reading the body, so keep that guarded
         try:
-            with async_timeout.timeout(self.request_timeout):
-                response = await self._session.request(
-                    method,
-                    url,
-                    json=data,
-                    headers=headers,
-                    ssl=True,
-                )
+            response = await self._session.request(
+                method,
+                url,
+                json=data,
+                headers=headers,
+                ssl=True,
+                timeout=self._timeout,
+            )
+
+            content_type = response.headers.get("Content-Type", "")
+            # Error handling
+            if (response.status // 100) in [4, 5]:
+                contents = await response.read()
+                response.close()
+
+                if response.status == 429:
+                    raise ToonRateLimitError(
+                        "Rate limit error has occurred with the Quby ToonAPI"
+                    )
+
+                if content_type == "application/json":
+                    raise ToonError(response.status, json_loads(contents))
+                raise ToonError(response.status, {"message": contents.decode("utf8")})
+
+            # Handle empty response
+            if response.status == 204:
+                return
+
+            if "application/json" in content_type:
+                # Decoded with orjson when available, stdlib json otherwise
+                return json_loads(await response.read())
+            return await response.text()
         except asyncio.TimeoutError as exception:
             raise ToonConnectionTimeoutError(
                 "Timeout occurred while connecting to the Quby ToonAPI"
@@ -126,28 +182,30 @@ class Toon:
                 "Error occurred while communicating with the Quby ToonAPI"
             ) from exception
 
-        content_type = response.headers.get("Content-Type", "")
-        # Error handling
-        if (response.status // 100) in [4, 5]:
-            contents = await response.read()
-            response.close()
-
-            if response.status == 429:
-                raise ToonRateLimitError(
-                    "Rate limit error has occurred with the Quby ToonAPI"
-                )
-
-            if content_type == "application/json":
-                raise ToonError(response.status, json.loads(contents.decode("utf8")))
-            raise ToonError(response.status, {"message": contents.decode("utf8")})
-
-        # Handle empty response
-        if response.status == 204:
-            return
-
-        if "application/json" in content_type:
-            return await response.json()
-        return await response.text()
+    @property
+    def request_timeout(self) -> int:
+        """Return the timeout in seconds for a request to the Quby ToonAPI."""
+        return self._request_timeout
+
+    @request_timeout.setter
+    def request_timeout(self, request_timeout: int) -> None:
+        """Set the request timeout, rebuilding the aiohttp timeout it is used as."""
+        self._request_timeout = request_timeout
+        self._timeout = aiohttp.ClientTimeout(total=request_timeout)
+
+    @property
+    def user_agent(self) -> str:
+        """Return the User-Agent sent with requests to the Quby ToonAPI."""
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, user_agent: str) -> None:
+        """Set the user agent, rebuilding the default headers it is sent with."""
+        self._user_agent = user_agent
+        self._base_headers = {
+            "User-Agent": user_agent,
+            "Accept": "application/json",
+        }
 
     async def activate_agreement(
         self,
@@ -163,16 +221,26 @@ class Toon:
         if not self._agreements:
             raise ToonError("No agreements found on linked account")
 
-        for known_agreement in self._agreements:
-            if (
-                known_agreement == agreement
-                or known_agreement.agreement_id == agreement_id
-                or known_agreement.display_common_name == display_common_name
-            ):
-                self._status = Status(agreement=known_agreement)
-                self.agreement_id = known_agreement.agreement_id
-                self.display_common_name = known_agreement.display_common_name
-                return known_agreement
+        known_agreement = None
+        if agreement is not None:
+            if agreement.agreement_id is not None:
+                known_agreement = self._agreements_by_id.get(agreement.agreement_id)
+            if known_agreement != agreement:
+                # E.g., an agreement without an ID, or sharing it with another
+                known_agreement = next(
+                    (known for known in self._agreements if known == agreement), None
+                )
+        if known_agreement is None and agreement_id is not None:
+            known_agreement = self._agreements_by_id.get(agreement_id)
+        if known_agreement is None and display_common_name is not None:
+            known_agreement = self._agreements_by_name.get(display_common_name)
+
+        if known_agreement is not None:
+            # Reuse the Status this agreement may already be tracked by
+            self._status = self._get_agreement_status(known_agreement)
+            self.agreement_id = known_agreement.agreement_id
+            self.display_common_name = known_agreement.display_common_name
+            return known_agreement
 
         raise ToonError("Agreement could not be found on the linked account")
 
@@ -185,16 +253,54 @@ class Toon:
             self._agreements = [
                 Agreement.from_dict(agreement) for agreement in agreements
             ]
+            # Index in reverse, so the first agreement wins on duplicate keys
+            self._agreements_by_id = {
+                agreement.agreement_id: agreement
+                for agreement in reversed(self._agreements)
+                if agreement.agreement_id is not None
+            }
+            self._agreements_by_name = {
+                agreement.display_common_name: agreement
+                for agreement in reversed(self._agreements)
+                if agreement.display_common_name is not None
+            }
         return self._agreements
 
-    async def update(self, data: dict[str, Any] | None = None) -> Status | None:
-        """Get all information in a single call."""
-        assert self._status
+    async def update(
+        self,
+        data: dict[str, Any] | None = None,
+        *,
+        agreement: Agreement | None = None,
+    ) -> Status | None:
+        """Get all information in a single call.
+
+        Updates the status of the active agreement, unless an agreement is
+        passed explicitly. Updates of different agreements do not share any
+        state, so these can be run concurrently (e.g., using asyncio.gather).
+        """
+        if agreement is None:
+            assert self._status
+            status = self._status
+        else:
+            status = self._get_agreement_status(agreement)
+
         if data is None:
             data = await self._request(
-                f"/toon/{TOON_API_VERSION}/{self.agreement_id}/status"
+                f"/toon/{TOON_API_VERSION}/{status.agreement.agreement_id}/status",
+                agreement=status.agreement,
             )
-        return self._status.update_from_dict(data)
+        return status.update_from_dict(data)
+
+    def _get_agreement_status(self, agreement: Agreement) -> Status:
+        """Return the Status object that tracks the given agreement."""
+        if self._status is not None and self._status.agreement == agreement:
+            return self._status
+
+        status = self._agreement_statuses.get(agreement.agreement_id)
+        if status is None or status.agreement != agreement:
+            status = Status(agreement=agreement)
+            self._agreement_statuses[agreement.agreement_id] = status
+        return status
 
     async def set_current_setpoint(self, temperature: float) -> None:
         """Set the target temperature for the thermostat."""
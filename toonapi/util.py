@@ -1,7 +1,9 @@
 """Collection of small utility functions for ToonAPI."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
+_EPOCH = datetime(1970, 1, 1)
+
 
 def convert_temperature(temperature: int) -> Optional[float]:
     """Convert a temperature value from the ToonAPI to a float value."""
@@ -19,23 +21,21 @@ def convert_boolean(value: Any) -> Optional[bool]:
 
 def convert_datetime(timestamp: int) -> datetime:
     """Convert a java microseconds timestamp from the ToonAPI to a datetime."""
-    return datetime.utcfromtimestamp(timestamp // 1000.0).replace(
-        microsecond=timestamp % 1000 * 1000
-    )
+    return _EPOCH + timedelta(milliseconds=timestamp)
 
 
 def convert_kwh(value: int) -> Optional[float]:
     """Convert a Wh value from the ToonAPI to a kWH value."""
     if value is None:
         return None
-    return round(float(value) / 1000.0, 2)
+    return (value + 5) // 10 / 100.0
 
 
 def convert_cm3(value: int) -> Optional[float]:
     """Convert a value from the ToonAPI to a CM3 value."""
     if value is None:
         return None
-    return round(float(value) / 1000.0, 2)
+    return (value + 5) // 10 / 100.0
 
 
 def convert_negative_none(value: int) -> Optional[int]:
@@ -47,11 +47,11 @@ def convert_m3(value: int) -> Optional[float]:
     """Convert a value from the ToonAPI to a M3 value."""
     if value is None:
         return None
-    return round(float(value) / 1000.0, 2)
+    return (value + 5) // 10 / 100.0
 
 
 def convert_lmin(value: int) -> Optional[float]:
     """Convert a value from the ToonAPI to a L/MINUTE value."""
     if value is None:
         return None
-    return round(float(value) / 60.0, 1)
+    return (value * 10 + 30) // 60 / 10.0